@@ -14,15 +14,17 @@ Examples:
 """
 from __future__ import annotations
 
+import copy
 import os
 import tempfile
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
+from functools import lru_cache
 from pprint import pformat
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from huggingface_hub import create_repo, hf_hub_download, upload_file
-from omegaconf import DictConfig, OmegaConf
+from omegaconf import DictConfig
 
 from .constants import (
     DEFAULT_MODEL_CONFIG_FILE,
@@ -33,7 +35,7 @@ from .constants import (
     PrecisionType,
     TaskType,
 )
-from .utils import Logger, get_module_config_class
+from .utils import Logger, get_module_config_class, load_yaml_config, save_yaml_config
 
 
 __all__ = [
@@ -62,6 +64,36 @@ _config_to_type_mapping = {
 _type_to_config_mapping = {v: k for k, v in _config_to_type_mapping.items()}
 
 
+def _field_value_to_dict(value):
+    """
+    Convert a single config field value the same way `dataclasses.asdict` does, without converting the whole config
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_field_value_to_dict(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _field_value_to_dict(v) for k, v in value.items()}
+    return copy.deepcopy(value)
+
+
+@lru_cache(maxsize=128)
+def _parse_config_file(config_path: str, modified_time: int, file_size: int) -> Dict:
+    # The file's modification time and size are part of the cache key so that changed files are parsed again
+    return load_yaml_config(config_path)
+
+
+def _load_config_file(config_path: str) -> Dict:
+    """
+    Load a config file as a dictionary. Parsed files are cached in memory, so loading the same file multiple times
+    (e.g, the configs of different modules from the same repo) does not read and parse it again.
+    """
+    file_stat = os.stat(config_path)
+    config = _parse_config_file(config_path, file_stat.st_mtime_ns, file_stat.st_size)
+    # Return a copy since callers modify the config dictionary
+    return copy.deepcopy(config)
+
+
 @dataclass
 class Config:
     """
@@ -89,7 +121,7 @@ class Config:
                 )
 
         # Convert enums to values
-        for param, value in self.dict().items():
+        for param in fields_dict:
             if isinstance(getattr(self, param), Enum):
                 setattr(self, param, str(getattr(self, param)))
 
@@ -97,16 +129,17 @@ class Config:
         return pformat(self.dict())
 
     def __getitem__(self, item):
-        try:
-            return self.dict()[item]
-        except KeyError:
+        # Only convert the requested field instead of the whole config, since unpacking a config (`**config`) calls
+        # this method for every key
+        if item not in self.fields():
             raise AttributeError(f"`{self.__class__.__name__}` does not have the parameter `{item}`!")
+        return _field_value_to_dict(getattr(self, item))
 
     def __len__(self):
-        return len(self.dict())
+        return len(self.fields())
 
     def __iter__(self):
-        return iter(self.dict())
+        return iter(self.fields())
 
     @classmethod
     def fields(cls):
@@ -122,7 +155,7 @@ class Config:
         return asdict(self)
 
     def keys(self):
-        return list(self.dict().keys())
+        return list(self.fields().keys())
 
     def get(self, key, default=None):
         return getattr(self, key, default)
@@ -140,8 +173,9 @@ class Config:
             The config object itself but the operation happens in-place anyway
         """
         d.update(kwargs)
+        config_fields = self.fields()
         for k, v in d.items():
-            if k not in self.fields():
+            if k not in config_fields:
                 logger.warning(f"`{str(self.__class__.__name__)}` does not take `{k}` as a config parameter!")
             setattr(self, k, v)
         return self
@@ -189,8 +223,7 @@ class Config:
                 repo_type=repo_type,
             )
         # Load config file and convert to dictionary
-        dict_config = OmegaConf.load(config_path)
-        config = OmegaConf.to_container(dict_config)
+        config = _load_config_file(config_path)
         # Check if config_type in the file and class are equal
         config_type = config.get("config_type", ConfigType.BASE)
         if config_type in _config_to_type_mapping.values():
@@ -251,7 +284,7 @@ class Config:
         # make and save to directory
         os.makedirs(os.path.join(save_dir, subfolder), exist_ok=True)
         save_path = os.path.join(save_dir, subfolder, filename)
-        OmegaConf.save(config, save_path)
+        save_yaml_config(config, save_path)
 
         return save_path
 
@@ -415,6 +448,15 @@ class TrainerConfig(Config):
             Number of dataloader workers, defaults to 4 .
         dataloader_shuffle (bool):
             Control dataloaders `shuffle` argument.
+        dataloader_pin_memory (bool):
+            Whether to use pinned memory in the dataloaders so that moving batches to the GPU can be done
+            asynchronously (non-blocking). Only applicable when training on CUDA. defaults to True.
+        dataloader_persistent_workers (bool):
+            Whether to keep the dataloader workers alive across epochs and evaluations instead of respawning them.
+            Only applicable when `num_dataloader_workers` is more than 0. defaults to True.
+        dataloader_prefetch_factor (int):
+            Number of batches loaded in advance by each dataloader worker. Only applicable when
+            `num_dataloader_workers` is more than 0. defaults to 4.
         seed (int):
             Control determinism of the run by setting a seed value. defaults to 42.
         optimizer (OptimizerType):
@@ -438,9 +480,16 @@ class TrainerConfig(Config):
         distributed (bool):
             Whether to use distributed training (via the `accelerate` package)
         mixed_precision (PrecisionType | str):
-            Mixed precision type e.g, fp16, bf16, etc. (disabled by default)
+            Mixed precision type e.g, fp16, bf16, etc. (disabled by default). If set to `auto`, bf16 is used on GPUs
+            that support it, fp16 on other GPUs and full precision on CPU.
+        max_grad_norm (float):
+            Maximum norm of the gradients for gradient clipping. Leave as None to disable clipping.
         use_cpu (bool):
             Whether to train using the CPU only even if CUDA is available.
+        compile_model (bool):
+            Whether to compile the model using `torch.compile` before training (requires PyTorch 2.2 or higher).
+        compile_mode (str):
+            The `mode` parameter passed to `torch.compile` e.g, `default`, `reduce-overhead`, `max-autotune`, etc.
         do_evaluate (bool):
             Whether to run evaluation when calling `Trainer.train`
         evaluate_with_generate (bool):
@@ -478,6 +527,9 @@ class TrainerConfig(Config):
     max_steps: int = None
     num_dataloader_workers: int = 0
     dataloader_shuffle: bool = True
+    dataloader_pin_memory: bool = True
+    dataloader_persistent_workers: bool = True
+    dataloader_prefetch_factor: int = 4
     seed: int = 42
     optimizer: str | OptimizerType = None
     learning_rate: float = 2e-5
@@ -490,7 +542,10 @@ class TrainerConfig(Config):
     gradient_accumulation_steps: int = 1
     distributed: bool = False
     mixed_precision: PrecisionType | str | None = None
+    max_grad_norm: float = None
     use_cpu: bool = False
+    compile_model: bool = False
+    compile_mode: str = "default"
     do_evaluate: bool = True
     evaluate_with_generate: bool = True
     metrics: List[str | MetricConfig] = None
@@ -120,6 +120,7 @@ class LossType(ExplicitEnum):
 
 class PrecisionType(ExplicitEnum):
     NO = "no"
+    AUTO = "auto"
     FP8 = "fp8"
     FP16 = "fp16"
     BF16 = "bf16"
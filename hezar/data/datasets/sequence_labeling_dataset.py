@@ -27,6 +27,9 @@ class SequenceLabelingDatasetConfig(DatasetConfig):
         ignore_index (int): Index to ignore in the loss function.
         label_all_tokens (bool): Whether to label all tokens or just the first token in a word.
         is_iob_schema (bool): Whether the dataset follows the IOB schema.
+        pretokenize (bool): Whether to tokenize the whole dataset once when loading it instead of tokenizing each
+            sample on access. The results are cached by 🤗 Datasets so later runs and epochs skip tokenization.
+        pretokenize_num_proc (int): Number of processes to use for pre-tokenization.
     """
 
     name = "sequence_labeling"
@@ -38,6 +41,8 @@ class SequenceLabelingDatasetConfig(DatasetConfig):
     ignore_index: int = -100
     label_all_tokens: bool = True
     is_iob_schema: bool = False  # Usually set to True for NER & Chunker and set to False for POS
+    pretokenize: bool = False
+    pretokenize_num_proc: int = None
 
 
 @register_dataset("sequence_labeling", config_class=SequenceLabelingDatasetConfig)
@@ -57,6 +62,8 @@ class SequenceLabelingDataset(Dataset):
         self._extract_labels()
         self.tokenizer = self.preprocessor.tokenizer
         self.data_collator = SequenceLabelingDataCollator(self.tokenizer, max_length=self.config.max_length)
+        if self.config.pretokenize:
+            self.data = self._pretokenize(self.data)
 
     def _load(self, split):
         """
@@ -81,6 +88,28 @@ class SequenceLabelingDataset(Dataset):
         self.label2id = self.config.label2id = {v: k for k, v in self.id2label.items()}
         self.num_labels = self.config.num_labels = len(tags_list)
 
+    def _pretokenize(self, data):
+        """
+        Tokenize and align the whole dataset at once using `datasets.Dataset.map()` which caches the results on disk.
+
+        Args:
+            data: The raw dataset.
+
+        Returns:
+            The tokenized dataset.
+        """
+        # Only the samples that are accessible based on `max_size` need to be tokenized
+        num_samples = super().__len__()
+        if num_samples < len(data):
+            data = data.select(range(num_samples))
+        data = data.map(
+            lambda sample: self._tokenize_and_align(*sample.values()),
+            remove_columns=data.column_names,
+            num_proc=self.config.pretokenize_num_proc,
+            desc="Tokenizing",
+        )
+        return data
+
     def _tokenize_and_align(self, tokens, labels):
         """
         Tokenize and align tokens and labels.
@@ -121,6 +150,12 @@ class SequenceLabelingDataset(Dataset):
         tokenized_inputs["labels"] = label_ids
         return tokenized_inputs
 
+    def __len__(self):
+        # The pre-tokenized data is already limited to `max_size` samples
+        if self.config.pretokenize:
+            return len(self.data)
+        return super().__len__()
+
     def __getitem__(self, index):
         """
         Tokenize inputs and return a dict containing ids, masks, labels, etc.
@@ -132,6 +167,8 @@ class SequenceLabelingDataset(Dataset):
             dict: The input data.
 
         """
+        if self.config.pretokenize:
+            return self.data[index]
         tokens, tags = self.data[index].values()
         inputs = self._tokenize_and_align(tokens, tags)
         return inputs
@@ -112,11 +112,14 @@ class DistilBertSequenceLabeling(Model):
         return_offsets: bool = False,
         return_scores: bool = False,
     ):
-        logits = model_outputs["logits"].softmax(2)
+        logits = model_outputs["logits"]
         tokens = model_outputs["tokens"]
         offsets = model_outputs["offsets"]
-        probs, predictions = logits.max(2)
-        predictions = [[self.config.id2label[p.item()] for p in prediction] for prediction in predictions]
+        # Only the probability of the predicted label is needed so instead of a full softmax over the labels,
+        # compute it in log space as `exp(max_logit - logsumexp(logits))`
+        max_logits, predictions = logits.max(2)
+        probs = (max_logits - logits.logsumexp(2)).exp().tolist()
+        predictions = [[self.config.id2label[p] for p in prediction] for prediction in predictions.tolist()]
         outputs = []
         for tokens_list, prediction, probs_, offsets_mapping in zip(tokens, predictions, probs, offsets):
             results = []
@@ -124,7 +127,7 @@ class DistilBertSequenceLabeling(Model):
                 if token not in self.config.prediction_skip_tokens:
                     token_results = {"token": token, "label": label}
                     if return_scores:
-                        token_results["score"] = prob.item()
+                        token_results["score"] = prob
                     if return_offsets:
                         start, end = offset
                         token_results["start"] = start
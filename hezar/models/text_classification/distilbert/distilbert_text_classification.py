@@ -40,8 +40,10 @@ class DistilBertTextClassification(Model):
         super().__init__(config, **kwargs)
         self.distilbert = DistilBertModel(self._build_inner_config())
         self.pre_classifier = nn.Linear(self.config.dim, self.config.dim)
+        self.relu = nn.ReLU(inplace=True)
         self.classifier = nn.Linear(self.config.dim, self.config.num_labels)
         self.dropout = nn.Dropout(self.config.seq_classif_dropout)
+        self.is_quantized = False
 
     def _build_inner_config(self):
         if self.config.num_labels is None and self.config.id2label is None:
@@ -73,7 +75,7 @@ class DistilBertTextClassification(Model):
         hidden_state = lm_outputs[0]
         pooled_output = hidden_state[:, 0]  # classification output
         pooled_output = self.pre_classifier(pooled_output)
-        pooled_output = nn.ReLU()(pooled_output)
+        pooled_output = self.relu(pooled_output)
         pooled_output = self.dropout(pooled_output)
         logits = self.classifier(pooled_output)
 
@@ -100,16 +102,51 @@ class DistilBertTextClassification(Model):
 
     def post_process(self, model_outputs: dict, top_k=1):
         output_logits = model_outputs["logits"]
-        outputs = []
-        for logits in output_logits:
-            probs = logits.softmax(dim=-1)
-            scores, label_ids = probs.sort(descending=True)
-            row = []
-            for i, (score, label_id) in enumerate(zip(scores, label_ids)):
-                if i == top_k:
-                    break
-                label_str = self.config.id2label[label_id.item()]
-                score = score.item()
-                row.append(TextClassificationOutput(label=label_str, score=score))
-            outputs.append(row)
+        num_labels = output_logits.shape[-1]
+        # Like the other text classification models, a `None` or negative `top_k` returns all the labels
+        top_k = num_labels if top_k is None or top_k < 0 else min(top_k, num_labels)
+        # Softmax is monotonic, so pick the top logits first and only normalize those instead of the whole softmax
+        top_logits, label_ids = output_logits.topk(top_k, dim=-1)
+        scores = (top_logits - output_logits.logsumexp(dim=-1, keepdim=True)).exp()
+        # Convert to lists all at once to avoid a device sync per item
+        scores, label_ids = scores.tolist(), label_ids.tolist()
+        outputs = [
+            [
+                TextClassificationOutput(label=self.config.id2label[label_id], score=score)
+                for score, label_id in zip(row_scores, row_label_ids)
+            ]
+            for row_scores, row_label_ids in zip(scores, label_ids)
+        ]
         return outputs
+
+    def quantize_for_inference(self):
+        """
+        Dynamically quantize the classification head (`pre_classifier` and `classifier`) weights to int8 in-place to
+        speed up CPU inference. The quantized model can only be used for inference, so it's put in eval mode and
+        calling `train()` or `save()` on it afterward raises an error.
+
+        Note that `torch.ao.quantization` is deprecated in recent PyTorch versions (it emits a `DeprecationWarning` and
+        is planned to be removed), so this method might not be available on future PyTorch releases.
+
+        Returns:
+            The model itself but the operation happens in-place anyway
+        """
+        if self.device.type != "cpu":
+            raise ValueError(f"Dynamic quantization is only supported on CPU but the model is on `{self.device}`!")
+        self.eval()
+        torch.ao.quantization.quantize_dynamic(self, {"pre_classifier", "classifier"}, dtype=torch.qint8, inplace=True)
+        self.is_quantized = True
+        return self
+
+    def train(self, mode: bool = True):
+        if mode and self.is_quantized:
+            raise ValueError("A model quantized using `quantize_for_inference()` cannot be trained!")
+        return super().train(mode)
+
+    def save(self, *args, **kwargs):
+        if self.is_quantized:
+            raise ValueError(
+                "A model quantized using `quantize_for_inference()` cannot be saved since its weights cannot be "
+                "loaded back to a regular model!"
+            )
+        return super().save(*args, **kwargs)
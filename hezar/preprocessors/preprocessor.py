@@ -5,11 +5,10 @@ from collections import OrderedDict
 from typing import List
 
 from huggingface_hub import hf_hub_download
-from omegaconf import OmegaConf
 
 from ..configs import PreprocessorConfig
 from ..constants import DEFAULT_PREPROCESSOR_SUBFOLDER, HEZAR_CACHE_DIR, Backends, RegistryType, RepoType
-from ..utils import get_module_class, get_parents, list_repo_files, verify_dependencies
+from ..utils import get_module_class, get_parents, list_repo_files, load_yaml_config, verify_dependencies
 
 
 class Preprocessor:
@@ -95,7 +94,7 @@ class Preprocessor:
                         repo_type=RepoType.MODEL,
                         cache_dir=cache_dir,
                     )
-                config = OmegaConf.load(config_file)
+                config = load_yaml_config(config_file)
                 name = config.get("name", None)
                 if name:
                     preprocessor_cls = get_module_class(name, registry_type=RegistryType.PREPROCESSOR)
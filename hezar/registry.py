@@ -58,7 +58,7 @@ __all__ = [
 logger = Logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Registry:
     module_class: type
     config_class: type = None
@@ -55,12 +55,13 @@ from .trainer_utils import (
     get_distributed_logger,
     get_lr_scheduler_type,
     resolve_logdir,
+    resolve_mixed_precision,
     write_to_tensorboard,
 )
 
 
 if is_backend_available(Backends.ACCELERATE):
-    from accelerate import Accelerator
+    from accelerate import Accelerator, DataLoaderConfiguration
 else:
     raise ImportError("The package `accelerate` needs to be installed to use `Trainer`!")
 
@@ -146,6 +147,9 @@ class Trainer:
         # Configuration
         self.config = config
         self.device = "cuda" if torch.cuda.is_available() and not self.config.use_cpu else "cpu"
+        self.config.mixed_precision = resolve_mixed_precision(self.config.mixed_precision, self.device)
+        self.pin_memory = self.config.dataloader_pin_memory and self.device == "cuda"
+        self.persistent_workers = self.config.dataloader_persistent_workers and self.config.num_dataloader_workers > 0
 
         # Setup hardware acceleration controller
         self.accelerator = accelerator or Accelerator(
@@ -153,6 +157,7 @@ class Trainer:
             cpu=True if self.device == "cpu" else False,
             step_scheduler_with_optimizer=False,
             gradient_accumulation_steps=self.config.gradient_accumulation_steps,
+            dataloader_config=DataLoaderConfiguration(non_blocking=self.pin_memory),
         )
 
         # Setup logger
@@ -162,6 +167,8 @@ class Trainer:
         self.train_dataset = train_dataset
         self.eval_dataset = eval_dataset
         self.data_collator = data_collator or getattr(self.train_dataset, "data_collator", None)
+        # Data loaders (and the datasets they're created for) are only kept when their workers are persistent
+        self._kept_dataloaders = {}
 
         # Configure steps
         self.num_batches = math.ceil(len(self.train_dataset) / self.config.batch_size)
@@ -279,10 +286,13 @@ class Trainer:
     def _setup_model(self, model: Model) -> Model:
         """
         Create and load the weights for the model. The weights will be loaded to the model depending
-        on `config.resume_from_checkpoint` or `config.init_weights_from`.
+        on `config.resume_from_checkpoint` or `config.init_weights_from`. The model is also compiled if
+        `config.compile_model` is set.
         """
         if model is None:
             raise ValueError("`model` must be given to the Trainer!")
+        if self.config.compile_model and not hasattr(model, "compile"):
+            raise ValueError("Setting `compile_model=True` requires PyTorch 2.2 or higher!")
 
         # Maybe load from checkpoint
         if self.config.resume_from_checkpoint:
@@ -304,6 +314,10 @@ class Trainer:
                     )
                 model.load_state_dict(torch.load(model_path))
 
+        # Compile in-place so that the model keeps its type, methods and state dict keys
+        if self.config.compile_model:
+            model.compile(mode=self.config.compile_mode)
+
         return model
 
     def create_train_dataloader(self, dataset) -> DataLoader:
@@ -328,6 +342,8 @@ class Trainer:
             sampler=sampler,
             num_workers=self.config.num_dataloader_workers,
             worker_init_fn=worker_init_fn,
+            pin_memory=self.pin_memory,
+            **self._dataloader_workers_kwargs(),
         )
 
         train_dataloader = self.accelerator.prepare(train_dataloader)
@@ -355,12 +371,56 @@ class Trainer:
             sampler=sampler,
             num_workers=self.config.num_dataloader_workers,
             worker_init_fn=worker_init_fn,
+            pin_memory=self.pin_memory,
+            **self._dataloader_workers_kwargs(),
         )
 
         eval_dataloader = self.accelerator.prepare(eval_dataloader)
 
         return eval_dataloader
 
+    def _dataloader_workers_kwargs(self):
+        """
+        Get the data loader arguments that are only valid when using worker processes
+        """
+        if self.config.num_dataloader_workers == 0:
+            return {}
+        kwargs = {
+            "persistent_workers": self.persistent_workers,
+            "prefetch_factor": self.config.dataloader_prefetch_factor,
+        }
+        if self.persistent_workers:
+            # A reused data loader does not draw its workers' base seed from the global RNG again, so use a dedicated
+            # generator for it to keep the global RNG state equal for new and reused data loaders
+            kwargs["generator"] = torch.Generator().manual_seed(self.config.seed)
+        return kwargs
+
+    def _get_dataloader(self, split: str, dataset, create_fn: Callable, reusable: bool = True):
+        """
+        Create a data loader for the dataset or reuse the one kept for the split if it was created for the same
+        dataset. Data loaders are only kept when their workers are persistent so that the workers are not respawned on
+        every epoch or evaluation.
+
+        Args:
+            split: Data loader split name, e.g, train, eval
+            dataset: The dataset to create the data loader for
+            create_fn: The function to create the data loader
+            reusable: Whether the data loader can be reused or kept
+
+        Returns:
+            The data loader
+        """
+        kept_dataset, dataloader = self._kept_dataloaders.get(split, (None, None))
+        if reusable and dataloader is not None and kept_dataset is dataset:
+            # Creating a data loader reseeds all RNGs (see `RangedSampler`), so do the same when reusing it
+            set_seed(self.config.seed)
+            return dataloader
+
+        dataloader = create_fn(dataset)
+        if reusable and self.persistent_workers:
+            self._kept_dataloaders[split] = (dataset, dataloader)
+        return dataloader
+
     def _create_optimizers(self, optimizer: torch.optim.Optimizer = None, lr_scheduler=None):
         """
         Set up the optimizer and lr lr_scheduler if they're not already given
@@ -437,7 +497,10 @@ class Trainer:
         """
         # Put inputs on device manually if accelerator is not available, otherwise it's taken care of by the accelerator
         if self.accelerator is None:
-            input_batch = {k: v.to(self.device) if isinstance(v, torch.Tensor) else v for k, v in input_batch.items()}
+            input_batch = {
+                k: v.to(self.device, non_blocking=self.pin_memory) if isinstance(v, torch.Tensor) else v
+                for k, v in input_batch.items()
+            }
 
         return input_batch
 
@@ -490,8 +553,11 @@ class Trainer:
         """
         Perform optimization step
         """
+        if self.config.max_grad_norm is not None and self.accelerator.sync_gradients:
+            self.accelerator.clip_grad_norm_(self.model.parameters(), self.config.max_grad_norm)
         self.optimizer.step()
-        self.optimizer.zero_grad()
+        # Setting grads to None instead of zeroing them avoids a memset per parameter
+        self.optimizer.zero_grad(set_to_none=True)
 
     def training_step(self, input_batch: Dict[str, torch.Tensor]) -> Dict[str, Any]:
         """
@@ -548,7 +614,13 @@ class Trainer:
         Returns:
             Metrics averages through the full iteration
         """
-        train_dataloader = self.create_train_dataloader(self.train_dataset)
+        # Resuming from the middle of an epoch needs a fresh data loader that starts from `epoch_step`
+        train_dataloader = self._get_dataloader(
+            "train",
+            self.train_dataset,
+            self.create_train_dataloader,
+            reusable=self.state.epoch_step == 0,
+        )
 
         self.model.train()
 
@@ -632,7 +704,14 @@ class Trainer:
             raise ValueError(
                 "Evaluation needs either passing the `eval_dataset` to the Trainer's `__init__` or `evaluate()`!"
             )
-        eval_dataloader = self.create_eval_dataloader(eval_dataset or self.eval_dataset)
+        eval_dataset = eval_dataset or self.eval_dataset
+        # Only the data loader of the trainer's own eval dataset is kept
+        eval_dataloader = self._get_dataloader(
+            "eval",
+            eval_dataset,
+            self.create_eval_dataloader,
+            reusable=eval_dataset is self.eval_dataset,
+        )
 
         self.metrics_handler.tracker.reset()
         self.model.eval()
@@ -692,6 +771,7 @@ class Trainer:
             "Number of Parameters": self.model.num_parameters,
             "Number of Trainable Parameters": self.model.num_trainable_parameters,
             "Mixed Precision": self.config.mixed_precision or "Full (fp32)",
+            "Compiled": f"Yes ({self.config.compile_mode})" if self.config.compile_model else "No",
             "Gradient Accumulation Steps": self.config.gradient_accumulation_steps,
             "Metrics": list(self.metrics_handler.metrics.keys()),
             "Save Steps": self.config.save_steps,
@@ -1,11 +1,16 @@
+from __future__ import annotations
+
 import os
 from dataclasses import asdict, dataclass
 
 import numpy as np
 import pandas as pd
-from omegaconf import OmegaConf
+import torch
 from torch.utils.tensorboard import SummaryWriter
 
+from ..constants import PrecisionType
+from ..utils import load_yaml_config, save_yaml_config
+
 
 __all__ = [
     "TrainerState",
@@ -16,6 +21,7 @@ __all__ = [
     "resolve_logdir",
     "get_distributed_logger",
     "get_lr_scheduler_type",
+    "resolve_mixed_precision",
 ]
 
 
@@ -78,15 +84,14 @@ class TrainerState:
         if drop_none:
             state = {k: v for k, v in state.items() if v is not None}
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        OmegaConf.save(state, path)
+        save_yaml_config(state, path)
 
     @classmethod
     def load(cls, path):
         """
         Load a trainer state from `path`
         """
-        state_file = OmegaConf.load(path)
-        state_dict = OmegaConf.to_container(state_file)
+        state_dict = load_yaml_config(path)
         state = cls(**state_dict)
         return state
 
@@ -195,3 +200,15 @@ def get_lr_scheduler_type(lr_scheduler, schedulers_mapping: dict):
     for name, scheduler_cls in schedulers_mapping.items():
         if isinstance(lr_scheduler, scheduler_cls):
             return name
+
+
+def resolve_mixed_precision(mixed_precision: str | None, device: str):
+    """
+    Resolve the `auto` mixed precision type to the best precision available on the device (bf16 > fp16 > no). The
+    resolved value is a plain string like the other config values, so that it's saved as is in the config file.
+    """
+    if mixed_precision != PrecisionType.AUTO:
+        return mixed_precision
+    if device == "cpu":
+        return PrecisionType.NO.value
+    return PrecisionType.BF16.value if torch.cuda.is_bf16_supported() else PrecisionType.FP16.value
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import inspect
+import os
 import re
+from functools import lru_cache
 from time import perf_counter
 from typing import Callable, Dict, List, Mapping
 
+import yaml
+from omegaconf import OmegaConf
+
 from ..constants import Color
 
 
+try:
+    from yaml import CSafeDumper as _BaseYamlDumper
+    from yaml import CSafeLoader as _BaseYamlLoader
+except ImportError:
+    from yaml import SafeDumper as _BaseYamlDumper
+    from yaml import SafeLoader as _BaseYamlLoader
+
+
 __all__ = [
     "exec_timer",
     "snake_case",
@@ -18,9 +31,80 @@ __all__ = [
     "permute_dict_list",
     "sanitize_function_parameters",
     "get_parents",
+    "load_yaml_config",
+    "save_yaml_config",
 ]
 
 
+class _YamlLoader(_BaseYamlLoader):
+    """
+    Safe YAML loader that uses the libyaml C bindings if available and resolves scalars the same way OmegaConf does
+    """
+
+    def flatten_mapping(self, node):
+        # Like OmegaConf, raise an error on duplicate keys instead of silently keeping the last value
+        keys = set()
+        for key_node, _ in node.value:
+            if key_node.tag != yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG:
+                continue
+            if key_node.value in keys:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    f"found duplicate key {key_node.value}",
+                    key_node.start_mark,
+                )
+            keys.add(key_node.value)
+        super().flatten_mapping(node)
+
+
+class _YamlDumper(_BaseYamlDumper):
+    """
+    Safe YAML dumper that uses the libyaml C bindings if available and quotes strings the same way OmegaConf does
+    """
+
+    # All the strings that YAML 1.1 loaders might resolve as booleans
+    bool_strings = frozenset(
+        "y Y yes Yes YES n N no No NO true True TRUE false False FALSE on On ON off Off OFF".split()
+    )
+
+    def represent_str(self, data):
+        # Like OmegaConf, single-quote the strings that look like booleans or numbers
+        with_quotes = data in self.bool_strings or _is_number_string(data)
+        return self.represent_scalar("tag:yaml.org,2002:str", data, style="'" if with_quotes else None)
+
+
+def _is_number_string(text: str) -> bool:
+    for number_type in (int, float):
+        try:
+            number_type(text)
+            return True
+        except ValueError:
+            pass
+    return False
+
+
+# Like OmegaConf, parse floats without a dot in the mantissa (e.g, `1e-5`) and keep timestamps as strings
+_float_resolver_regexp = re.compile(
+    r"""^(?:
+     [-+]?[0-9]+(?:_[0-9]+)*\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?:[eE][-+]?[0-9]+)
+    |\.[0-9]+(?:_[0-9]+)*(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?::[0-5]?[0-9])+\.[0-9_]*
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$""",
+    re.X,
+)
+_YamlLoader.add_implicit_resolver("tag:yaml.org,2002:float", _float_resolver_regexp, list("-+0123456789."))
+# Makes the dumper quote the strings that look like such floats so that they're loaded back as strings
+_YamlDumper.add_implicit_resolver("tag:yaml.org,2002:float", _float_resolver_regexp, list("-+0123456789."))
+_YamlDumper.add_representer(str, _YamlDumper.represent_str)
+_YamlLoader.yaml_implicit_resolvers = {
+    key: [(tag, regexp) for tag, regexp in resolvers if tag != "tag:yaml.org,2002:timestamp"]
+    for key, resolvers in _YamlLoader.yaml_implicit_resolvers.items()
+}
+
+
 class exec_timer:
     """
     A context manager that captures the execution time of all the operations inside it
@@ -130,13 +214,67 @@ def sanitize_function_parameters(func: Callable, params: Dict | Mapping, **kwarg
         The proper dict of parameters keys and values
     """
     params.update(**kwargs)
-    params_signature = dict(inspect.signature(func).parameters)
-    fn_parameters = {p for p, v in params_signature.items() if v.kind not in (v.VAR_KEYWORD, v.VAR_POSITIONAL)}
-    fn_params_names = set(fn_parameters)
+    # Plain functions and methods are looked up by their underlying function so that the signature is not inspected on
+    # every call (e.g, the model's forward in the training loop) and no bound object is kept alive by the cache.
+    fn = getattr(func, "__func__", func)
+    if inspect.isfunction(fn):
+        fn_params_names = _get_function_parameters_names(fn, skip_first=fn is not func)
+    else:
+        fn_params_names = _inspect_function_parameters_names(func)
     input_params = {p: params[p] for p in fn_params_names if p in params}
     return input_params
 
 
+def _inspect_function_parameters_names(func: Callable, skip_first: bool = False):
+    params = list(inspect.signature(func).parameters.values())
+    if skip_first:
+        params = params[1:]
+    return frozenset(p.name for p in params if p.kind not in (p.VAR_KEYWORD, p.VAR_POSITIONAL))
+
+
+_get_function_parameters_names = lru_cache(maxsize=None)(_inspect_function_parameters_names)
+
+
+def load_yaml_config(path: str | os.PathLike) -> Dict:
+    """
+    Load a YAML config file as a plain dictionary. This is equivalent to `OmegaConf.to_container(OmegaConf.load(path))`
+    but parses the file using the libyaml C bindings (if available) and skips creating the intermediate `DictConfig`.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        The config as a dictionary
+    """
+    with open(path, encoding="utf-8") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    return config if config is not None else {}
+
+
+def save_yaml_config(config: Mapping, path: str | os.PathLike):
+    """
+    Save a config dictionary to a YAML file. The output is the same as `OmegaConf.save(config, path)` but plain values
+    are dumped using the libyaml C bindings (if available) without creating an intermediate `DictConfig`. Configs
+    containing values that are not supported by plain YAML (e.g, tuples) are still saved using OmegaConf.
+
+    Args:
+        config: The config dictionary to save
+        path: Path to the YAML file
+    """
+    try:
+        content = yaml.dump(
+            config,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+    except yaml.representer.RepresenterError:
+        content = OmegaConf.to_yaml(config)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
 def get_parents(obj, include_self=True, names_only=False):
     """
     Get all parent classes of an object
@@ -225,14 +225,20 @@ def flatten_dict(dict_config: Dict | DictConfig) -> DictConfig:
         The flattened version of the dict-like object
     """
 
-    config = DictConfig({})
-    for k, v in dict_config.items():
-        if isinstance(v, (Dict, DictConfig)):
-            config.update(flatten_dict(v))
+    # Flatten iteratively into a plain dict (depth-first, keeping the keys order) and create the DictConfig only once,
+    # since creating and updating DictConfig objects is much slower than plain dicts
+    flat_dict = {}
+    stack = [iter(dict_config.items())]
+    while stack:
+        for k, v in stack[-1]:
+            if isinstance(v, (Dict, DictConfig)):
+                stack.append(iter(v.items()))
+                break
+            flat_dict[k] = v
         else:
-            config[k] = v
+            stack.pop()
 
-    return config
+    return DictConfig(flat_dict)
 
 
 def set_seed(seed):
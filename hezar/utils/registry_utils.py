@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from ..constants import RegistryType
 from .common_utils import snake_case
 
@@ -45,42 +47,60 @@ def list_available_embeddings():
     return sorted(registry.keys())
 
 
-def _get_registry_from_type(registry_type: RegistryType):
-    if registry_type == RegistryType.MODEL:
-        from ..models import Model  # noqa
-        from ..registry import models_registry  # noqa
+def _load_models_registry():
+    from ..models import Model  # noqa
+    from ..registry import models_registry  # noqa
+
+    return models_registry
+
+
+def _load_preprocessors_registry():
+    from ..preprocessors import Preprocessor  # noqa
+    # Also import models since some preprocessors are in their own model module
+    from ..models import Model  # noqa
+    from ..registry import preprocessors_registry  # noqa
 
-        registry = models_registry
+    return preprocessors_registry
 
-    elif registry_type == RegistryType.PREPROCESSOR:
-        from ..preprocessors import Preprocessor  # noqa
-        # Also import models since some preprocessors are in their own model module
-        from ..models import Model  # noqa
-        from ..registry import preprocessors_registry  # noqa
 
-        registry = preprocessors_registry
+def _load_datasets_registry():
+    from ..data import Dataset  # noqa
+    from ..registry import datasets_registry  # noqa
 
-    elif registry_type == RegistryType.DATASET:
-        from ..data import Dataset  # noqa
-        from ..registry import datasets_registry  # noqa
+    return datasets_registry
 
-        registry = datasets_registry
 
-    elif registry_type == RegistryType.EMBEDDING:
-        from ..embeddings import Embedding  # noqa
-        from ..registry import embeddings_registry  # noqa
+def _load_embeddings_registry():
+    from ..embeddings import Embedding  # noqa
+    from ..registry import embeddings_registry  # noqa
 
-        registry = embeddings_registry
+    return embeddings_registry
 
-    elif registry_type == RegistryType.METRIC:
-        from ..metrics import Metric  # noqa
-        from ..registry import metrics_registry  # noqa
 
-        registry = metrics_registry
+def _load_metrics_registry():
+    from ..metrics import Metric  # noqa
+    from ..registry import metrics_registry  # noqa
 
-    else:
+    return metrics_registry
+
+
+_registry_loaders = {
+    RegistryType.MODEL: _load_models_registry,
+    RegistryType.PREPROCESSOR: _load_preprocessors_registry,
+    RegistryType.DATASET: _load_datasets_registry,
+    RegistryType.EMBEDDING: _load_embeddings_registry,
+    RegistryType.METRIC: _load_metrics_registry,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_registry_from_type(registry_type: RegistryType):
+    # The registry containers are module-level dicts that modules register themselves into, so it's safe to cache the
+    # containers themselves (but not their contents) and skip the imports on later calls.
+    if registry_type not in _registry_loaders:
         raise ValueError(f"Invalid `registry_type`: {registry_type}!")
 
+    registry = _registry_loaders[registry_type]()
     return registry
 
 
@@ -0,0 +1,28 @@
+import os
+
+from hezar.configs import ModelConfig, _load_config_file
+from hezar.models import DistilBertTextClassificationConfig
+
+
+def test_config_file_cache_is_invalidated_on_rewrite(tmp_path):
+    config_path = DistilBertTextClassificationConfig(num_labels=2).save(str(tmp_path), "model_config.yaml")
+    assert ModelConfig.load(str(tmp_path), filename="model_config.yaml").num_labels == 2
+
+    # Callers modify the loaded dictionary, so it must not leak into the cache
+    _load_config_file(config_path)["num_labels"] = 3
+    assert _load_config_file(config_path)["num_labels"] == 2
+
+    DistilBertTextClassificationConfig(num_labels=10).save(str(tmp_path), "model_config.yaml")
+    # Make sure the modification time changes even on file systems with a coarse timestamp resolution
+    file_stat = os.stat(config_path)
+    os.utime(config_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+    config = ModelConfig.load(str(tmp_path), filename="model_config.yaml")
+    assert isinstance(config, DistilBertTextClassificationConfig)
+    assert config.num_labels == 10
+
+
+def test_config_save_load_round_trip(tmp_path):
+    config = DistilBertTextClassificationConfig(id2label={0: "negative", 1: "positive"}, dropout=1e-1, activation="relu")
+    config.save(str(tmp_path), "model_config.yaml")
+    loaded_config = ModelConfig.load(str(tmp_path), filename="model_config.yaml")
+    assert loaded_config.dict() == config.dict()
@@ -1,10 +1,13 @@
 import os
 from typing import Dict
 
+import datasets
 import pytest
+from tokenizers import pre_tokenizers, trainers
 from torch.utils.data import DataLoader
 
-from hezar.data import Dataset
+from hezar.data import Dataset, SequenceLabelingDataset, SequenceLabelingDatasetConfig
+from hezar.preprocessors import WordPieceConfig, WordPieceTokenizer
 from hezar.utils import clean_cache
 
 
@@ -109,3 +112,48 @@ def test_load_dataset(task):
     # Clean cache so that CI environment does not run out of space
     if CI_MODE == "TRUE":
         clean_cache(delay=1)
+
+
+class LocalSequenceLabelingDataset(SequenceLabelingDataset):
+    """
+    A sequence labeling dataset with a small in-memory dataset so that it can be tested without downloading anything
+    """
+
+    def _load(self, split):
+        features = datasets.Features(
+            {
+                "tokens": datasets.Sequence(datasets.Value("string")),
+                "pos_tags": datasets.Sequence(datasets.ClassLabel(names=["N", "V", "ADJ"])),
+            }
+        )
+        data = {
+            "tokens": [["سلام", "دنیا", "hello", "world"], ["a", "bb", "ccc"], ["hello"]] * 20,
+            "pos_tags": [[0, 1, 2, 0], [1, 1, 0], [2]] * 20,
+        }
+        return datasets.Dataset.from_dict(data, features=features)
+
+
+def build_local_tokenizer():
+    tokenizer = WordPieceTokenizer(WordPieceConfig())
+    tokenizer._tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer._tokenizer.train_from_iterator(
+        ["سلام دنیا hello world", "a bb ccc"],
+        trainer=trainers.WordPieceTrainer(vocab_size=100, special_tokens=["[PAD]", "[UNK]", "[CLS]", "[SEP]"]),
+    )
+    return tokenizer
+
+
+@pytest.mark.parametrize("max_size", [None, 7, 0.1])
+def test_pretokenized_sequence_labeling_dataset(max_size):
+    tokenizer = build_local_tokenizer()
+    config_kwargs = {"tokens_field": "tokens", "tags_field": "pos_tags", "max_size": max_size}
+    dataset = LocalSequenceLabelingDataset(SequenceLabelingDatasetConfig(**config_kwargs), preprocessor=tokenizer)
+    pretokenized_dataset = LocalSequenceLabelingDataset(
+        SequenceLabelingDatasetConfig(**config_kwargs, pretokenize=True),
+        preprocessor=tokenizer,
+    )
+
+    expected_length = {None: 60, 7: 7, 0.1: 6}[max_size]
+    assert len(dataset) == len(pretokenized_dataset) == expected_length
+    for index in range(expected_length):
+        assert dict(dataset[index]) == dict(pretokenized_dataset[index])
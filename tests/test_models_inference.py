@@ -1,9 +1,10 @@
 import os
 
 import pytest
+import torch
 
 from hezar.builders import build_model
-from hezar.models import ModelConfig
+from hezar.models import DistilBertTextClassification, DistilBertTextClassificationConfig, ModelConfig
 from hezar.preprocessors import Preprocessor
 from hezar.utils import clean_cache, set_seed
 
@@ -105,3 +106,39 @@ def test_model_inference(task):
 
     if CI_MODE == "TRUE":
         clean_cache(delay=1)
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning", "ignore::UserWarning")
+def test_quantize_distilbert_text_classification_for_inference(tmp_path):
+    set_seed(42)
+    model_config = DistilBertTextClassificationConfig(
+        id2label={0: "negative", 1: "positive"},
+        dim=16,
+        hidden_dim=32,
+        n_heads=2,
+        n_layers=1,
+        vocab_size=100,
+        max_position_embeddings=16,
+    )
+    model = DistilBertTextClassification(model_config).eval()
+    quantized_model = DistilBertTextClassification(model_config)
+    quantized_model.load_state_dict(model.state_dict())
+    quantized_model.quantize_for_inference()
+
+    # Only the classification head is quantized
+    assert not quantized_model.training
+    assert isinstance(quantized_model.pre_classifier, torch.ao.nn.quantized.dynamic.Linear)
+    assert isinstance(quantized_model.classifier, torch.ao.nn.quantized.dynamic.Linear)
+    encoder_linears = [m for m in quantized_model.distilbert.modules() if isinstance(m, torch.nn.Linear)]
+    assert encoder_linears and all(type(m) is torch.nn.Linear for m in encoder_linears)
+
+    token_ids = torch.randint(0, 100, (4, 8))
+    with torch.inference_mode():
+        logits = model(token_ids)["logits"]
+        quantized_logits = quantized_model(token_ids)["logits"]
+    assert torch.allclose(logits, quantized_logits, atol=1e-2)
+
+    with pytest.raises(ValueError):
+        quantized_model.train()
+    with pytest.raises(ValueError):
+        quantized_model.save(str(tmp_path))
@@ -9,13 +9,15 @@ import os
 import shutil
 
 import pytest
+import torch
 
 from hezar.builders import build_model
 from hezar.data import Dataset
-from hezar.models import ModelConfig
-from hezar.preprocessors import Preprocessor
+from hezar.models import DistilBertTextClassification, DistilBertTextClassificationConfig, ModelConfig
+from hezar.preprocessors import Preprocessor, WordPieceConfig, WordPieceTokenizer
 from hezar.trainer import Trainer, TrainerConfig
-from hezar.utils import clean_cache
+from hezar.trainer.trainer_utils import resolve_mixed_precision
+from hezar.utils import clean_cache, load_yaml_config
 
 
 CI_MODE = os.environ.get("CI_MODE", "FALSE")
@@ -176,3 +178,140 @@ def test_trainer(task):
     # Clean cache so that CI environment does not run out of space
     if CI_MODE == "TRUE":
         clean_cache(delay=1)
+
+
+@pytest.mark.parametrize(
+    "device,bf16_supported,expected_mixed_precision",
+    [("cpu", True, "no"), ("cuda", True, "bf16"), ("cuda", False, "fp16")],
+)
+def test_resolve_auto_mixed_precision(tmp_path, monkeypatch, device, bf16_supported, expected_mixed_precision):
+    monkeypatch.setattr(torch.cuda, "is_bf16_supported", lambda *args, **kwargs: bf16_supported)
+    config = TrainerConfig(task="text_classification", output_dir=str(tmp_path), mixed_precision="auto")
+    config.mixed_precision = resolve_mixed_precision(config.mixed_precision, device=device)
+    assert config.mixed_precision == expected_mixed_precision and type(config.mixed_precision) is str
+
+    config_path = config.save(str(tmp_path), "train_config.yaml")
+    assert load_yaml_config(config_path)["mixed_precision"] == expected_mixed_precision
+
+    # Explicit values are kept as is
+    assert resolve_mixed_precision("fp16", device=device) == "fp16"
+    assert resolve_mixed_precision(None, device=device) is None
+
+
+class RandomTextClassificationDataset(torch.utils.data.Dataset):
+    """
+    A tiny random dataset so that the trainer's data pipeline can be tested without downloading anything
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return {
+            "token_ids": torch.randint(0, 100, (8,)),
+            "attention_mask": torch.ones(8, dtype=torch.long),
+            "labels": torch.tensor(index % 2),
+        }
+
+    @staticmethod
+    def data_collator(samples):
+        return {key: torch.stack([sample[key] for sample in samples]) for key in samples[0]}
+
+
+def build_tiny_trainer(output_dir, train_size=10, eval_size=4, **config_kwargs):
+    model_config = DistilBertTextClassificationConfig(
+        id2label={0: "negative", 1: "positive"},
+        dim=16,
+        hidden_dim=32,
+        n_heads=2,
+        n_layers=1,
+        vocab_size=100,
+        max_position_embeddings=16,
+    )
+    config_kwargs.setdefault("use_cpu", True)
+    config_kwargs.setdefault("num_epochs", 1)
+    config = TrainerConfig(
+        task="text_classification",
+        output_dir=output_dir,
+        batch_size=2,
+        metrics=["accuracy"],
+        save_enabled=False,
+        **config_kwargs,
+    )
+    trainer = Trainer(
+        config=config,
+        model=DistilBertTextClassification(model_config),
+        train_dataset=RandomTextClassificationDataset(train_size),
+        eval_dataset=RandomTextClassificationDataset(eval_size),
+        data_collator=RandomTextClassificationDataset.data_collator,
+        preprocessor=WordPieceTokenizer(WordPieceConfig()),
+    )
+    return trainer
+
+
+@pytest.mark.parametrize("num_dataloader_workers", [0, 2])
+def test_trainer_reuses_dataloaders_with_persistent_workers(tmp_path, monkeypatch, num_dataloader_workers):
+    trainer = build_tiny_trainer(str(tmp_path), num_epochs=2, num_dataloader_workers=num_dataloader_workers)
+    created_dataloaders = []
+    for create_fn_name in ("create_train_dataloader", "create_eval_dataloader"):
+        create_fn = getattr(trainer, create_fn_name)
+
+        def create_dataloader(dataset, create_fn=create_fn, create_fn_name=create_fn_name):
+            created_dataloaders.append(create_fn_name)
+            return create_fn(dataset)
+
+        monkeypatch.setattr(trainer, create_fn_name, create_dataloader)
+
+    trainer.train()
+    trainer.evaluate()
+
+    if num_dataloader_workers > 0:
+        # Workers are persistent by default, so the same data loaders are used for all epochs and evaluations
+        assert created_dataloaders.count("create_train_dataloader") == 1
+        assert created_dataloaders.count("create_eval_dataloader") == 1
+        assert set(trainer._kept_dataloaders) == {"train", "eval"}
+        eval_dataloader = trainer._kept_dataloaders["eval"][1]
+
+        # Other eval datasets get their own data loader without replacing the kept one
+        trainer.evaluate(RandomTextClassificationDataset(2))
+        assert created_dataloaders.count("create_eval_dataloader") == 2
+        assert trainer._kept_dataloaders["eval"][1] is eval_dataloader
+
+        # A kept data loader is not used for a new train dataset
+        trainer.train_dataset = RandomTextClassificationDataset(10)
+        trainer.inner_training_loop(epoch_num=3)
+        assert created_dataloaders.count("create_train_dataloader") == 2
+        assert trainer._kept_dataloaders["train"][0] is trainer.train_dataset
+    else:
+        assert created_dataloaders.count("create_train_dataloader") == 2
+        assert created_dataloaders.count("create_eval_dataloader") == 3
+        assert trainer._kept_dataloaders == {}
+
+
+@pytest.mark.parametrize("num_dataloader_workers,persistent_workers", [(0, True), (2, True), (2, False)])
+def test_trainer_reseeds_every_epoch(tmp_path, monkeypatch, num_dataloader_workers, persistent_workers):
+    trainer = build_tiny_trainer(
+        str(tmp_path),
+        num_epochs=3,
+        num_dataloader_workers=num_dataloader_workers,
+        dataloader_persistent_workers=persistent_workers,
+    )
+    training_step = trainer.training_step
+    epochs_rng_states = []
+
+    def record_rng_state_training_step(input_batch):
+        if trainer.state.epoch_step == 0:
+            epochs_rng_states.append(torch.get_rng_state())
+        return training_step(input_batch)
+
+    monkeypatch.setattr(trainer, "training_step", record_rng_state_training_step)
+    trainer.train()
+
+    # Every epoch must start from the same RNG state whether its data loader is new or reused, so that, e.g, resuming
+    # from an epoch's checkpoint gives the same dropout masks as an uninterrupted run
+    assert len(epochs_rng_states) == 3
+    for rng_state in epochs_rng_states[1:]:
+        assert torch.equal(rng_state, epochs_rng_states[0])
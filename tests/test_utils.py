@@ -0,0 +1,74 @@
+import pytest
+import yaml
+from omegaconf import OmegaConf
+
+from hezar.utils import load_yaml_config, save_yaml_config
+
+
+YAML_CONFIG = """
+name: distilbert_text_classification
+learning_rate: 1e-5
+weight_decay: .5
+max_steps: 1_000
+ratio: 1.5e3
+infinity: .inf
+date: 2024-01-01
+flag: yes
+empty: null
+text: سلام
+id2label:
+  0: negative
+  1: positive
+metrics:
+  - accuracy
+  - f1
+"""
+
+
+def test_load_yaml_config_matches_omegaconf(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(YAML_CONFIG, encoding="utf-8")
+    assert load_yaml_config(config_path) == OmegaConf.to_container(OmegaConf.load(config_path))
+
+
+def test_load_yaml_config_empty_file(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("", encoding="utf-8")
+    assert load_yaml_config(config_path) == {}
+
+
+def test_load_yaml_config_rejects_duplicate_keys(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("a: 1\nb:\n  c: 2\n  c: 3\n", encoding="utf-8")
+    with pytest.raises(yaml.constructor.ConstructorError, match="found duplicate key c"):
+        load_yaml_config(config_path)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "learning_rate": 1e-5,
+            "learning_rate_str": "1e-5",
+            "flag": True,
+            "flag_str": "yes",
+            "empty": None,
+            "empty_str": "null",
+            "date_str": "2024-01-01",
+            "short_bool_strs": ["y", "n", "Y", "N", "on", "off"],
+            "number_strs": ["NaN", "inf", "1_000", "0x1F", "017", "1:30"],
+            "y": "key",
+            "text": "سلام",
+            "id2label": {0: "negative", 1: "positive"},
+            "metrics": ["accuracy", {"name": "f1", "average": "macro"}],
+        },
+        # Not supported by plain YAML, so it's saved using OmegaConf
+        {"input_shape": (1, 3, 224, 224)},
+    ],
+)
+def test_save_yaml_config_matches_omegaconf(tmp_path, config):
+    omegaconf_path, config_path = tmp_path / "omegaconf.yaml", tmp_path / "config.yaml"
+    OmegaConf.save(config, omegaconf_path)
+    save_yaml_config(config, config_path)
+    assert config_path.read_text(encoding="utf-8") == omegaconf_path.read_text(encoding="utf-8")
+    assert load_yaml_config(config_path) == OmegaConf.to_container(OmegaConf.load(omegaconf_path))